@@ -1,8 +1,11 @@
 """vault-ui main application."""
 
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+from contextlib import suppress
 
 import uvicorn
 
@@ -19,6 +22,35 @@ app = create_app()
 
 _VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR"}
 
+_LOG_QUEUE_MAXSIZE = 10000
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of erroring when the queue is full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue without blocking; a full queue drops the record."""
+        with suppress(queue.Full):
+            self.queue.put_nowait(record)
+
+
+def _install_queue_logging(
+    logger: logging.Logger, maxsize: int = _LOG_QUEUE_MAXSIZE
+) -> logging.handlers.QueueListener:
+    """Move ``logger``'s handlers behind a bounded queue drained by a background thread.
+
+    Logging calls on the event loop become a non-blocking enqueue; the stream
+    write happens on the ``QueueListener`` thread. The caller owns the returned
+    listener and must ``stop()`` it on shutdown to flush pending records.
+    """
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=maxsize)
+    listener = logging.handlers.QueueListener(
+        log_queue, *logger.handlers, respect_handler_level=True
+    )
+    logger.handlers = [_DroppingQueueHandler(log_queue)]
+    listener.start()
+    return listener
+
 
 def _parse_log_level(raw: str | None) -> tuple[int, str, str | None]:
     """Parse the LOG_LEVEL env var.
@@ -55,6 +87,8 @@ def main() -> int:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    listener = _install_queue_logging(logging.getLogger())
+
     if fallback_warning is not None:
         logging.getLogger(__name__).warning(fallback_warning)
 
@@ -72,6 +106,8 @@ def main() -> int:
     except FileNotFoundError as e:
         print(str(e), file=sys.stderr)
         return 1
+    finally:
+        listener.stop()
 
     return 0
 
@@ -6,7 +6,7 @@ from datetime import datetime
 from pydantic import BaseModel
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Task from Obsidian vault."""
 
@@ -37,7 +37,7 @@ class Task:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Goal:
     """Goal from Obsidian vault."""
 
@@ -3,16 +3,18 @@
 # FastAPI Depends pattern is safe in function signatures
 
 import asyncio
-import json
+import functools
 import logging
 import os
 import shlex
+import time
 from contextlib import suppress
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any, Literal
 from urllib.parse import quote
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
 
@@ -25,13 +27,14 @@ from vault_ui.api.models import (
     TaskResponse,
 )
 from vault_ui.cleanup import derive_claude_project_dir
-from vault_ui.config import VaultConfig
+from vault_ui.config import VaultConfig, obsidian_url_prefix
 from vault_ui.factory import (
     get_config,
     get_status_cache,
     get_vault_cli_client_for_vault,
     get_vault_config,
 )
+from vault_ui.hierarchy import discover_hierarchy_folders
 from vault_ui.session_resolver import is_uuid, resolve_session_id
 
 if TYPE_CHECKING:
@@ -41,6 +44,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Phases a task may carry; anything else (None, typos, legacy values) is shown as todo.
+_VALID_PHASES = frozenset(
+    {"todo", "planning", "in_progress", "execution", "ai_review", "human_review", "done"}
+)
+
+# Statuses shown by /api/tasks when no status filter is given.
+_DEFAULT_STATUS_FILTER = frozenset({"todo", "next", "in_progress", "completed"})
+
 # Global connection manager (injected via set_connection_manager)
 _connection_manager: "ConnectionManager | None" = None
 
@@ -87,7 +98,7 @@ async def _drain_stream(
       are disambiguable in interleaved log output.
     - Decodes for logging with ``errors='replace'`` so non-UTF8 bytes do not crash
       the drain loop; the raw bytes are preserved verbatim in ``buffer`` so the
-      final ``json.loads`` sees byte-identical input.
+      final ``orjson.loads`` sees byte-identical input.
     - On an oversized single line (``asyncio.LimitOverrunError`` from the
       ``StreamReader``'s 1 MiB buffer), logs a WARN and breaks out of the loop
       so the caller can fall through to ``proc.communicate()`` for the remainder.
@@ -162,14 +173,14 @@ async def start_vault_cli_session(vault_config: VaultConfig, task_id: str) -> st
             f"vault-cli work-on failed: {bytes(stderr_buf).decode(errors='replace').strip()}"
         )
 
-    stdout_text = bytes(stdout_buf).decode()
     # vault-cli --output json emits a single JSON object, possibly preceded by
     # JSONL progress lines; parse the last non-empty line to handle both formats.
+    # orjson parses the raw bytes directly — no intermediate str decode.
     last_line = next(
-        (line for line in reversed(stdout_text.splitlines()) if line.strip()),
-        stdout_text,
+        (line for line in reversed(stdout_buf.splitlines()) if line.strip()),
+        stdout_buf,
     )
-    result: dict[str, Any] = json.loads(last_line)
+    result: dict[str, Any] = orjson.loads(last_line)
     session_id: str = result.get("session_id") or ""
     if not session_id:
         warnings: list[str] = result.get("warnings") or []
@@ -256,16 +267,20 @@ async def list_assignees(
     vault_filter = _flatten_filter(vault)
     vault_names = [v.name for v in config.vaults] if vault_filter is None else vault_filter
 
-    named: set[str] = set()
-    has_unassigned = False
-
+    clients = []
     for vault_name in vault_names:
         try:
-            client = get_vault_cli_client_for_vault(vault_name)
+            clients.append(get_vault_cli_client_for_vault(vault_name))
         except ValueError:
             continue  # Skip invalid vault names, matching list_tasks behavior
 
-        tasks = await client.list_tasks(show_all=True)
+    # Fan out the per-vault vault-cli calls so their subprocess I/O overlaps
+    task_lists = await asyncio.gather(*[client.list_tasks(show_all=True) for client in clients])
+
+    named: set[str] = set()
+    has_unassigned = False
+
+    for tasks in task_lists:
         for task in tasks:
             raw = task.assignee
             if isinstance(raw, str) and raw.strip() != "":
@@ -279,11 +294,15 @@ async def list_assignees(
     )
 
 
+@functools.lru_cache(maxsize=1024)
 def _parse_defer_date(defer_date: str) -> datetime:
     """Parse defer_date string into a timezone-aware datetime.
 
     Accepts both date-only (YYYY-MM-DD) and RFC3339 datetime formats.
     Date-only values are treated as midnight UTC on that date.
+
+    Memoized: many tasks share the same defer_date, and the result is an
+    immutable datetime, so each distinct string is parsed once per process.
     """
     try:
         d = date.fromisoformat(defer_date)
@@ -326,7 +345,7 @@ async def _process_vault(
 
     # get tasks
     effective_status_filter = (
-        status_filter if status_filter is not None else ["todo", "next", "in_progress", "completed"]
+        frozenset(status_filter) if status_filter is not None else _DEFAULT_STATUS_FILTER
     )
 
     tasks_dir = Path(vault_config.vault_path) / vault_config.tasks_folder
@@ -354,20 +373,18 @@ async def _process_vault(
 
     # Filter by phase if specified (tasks with None/invalid phase default to todo)
     if phase_filter:
-        valid_phases = [
-            "todo",
-            "planning",
-            "in_progress",
-            "execution",
-            "ai_review",
-            "human_review",
-            "done",
-        ]
+        phase_set = frozenset(phase_filter)
+        include_invalid = "todo" in phase_set
         tasks = [
             t
             for t in tasks
-            if (t.phase in valid_phases and t.phase in phase_filter)
-            or (t.phase not in valid_phases and "todo" in phase_filter)
+            # Raw frontmatter may hold unhashable values (e.g. a list); treat
+            # anything but a known phase string as invalid rather than raising
+            if (
+                t.phase in phase_set
+                if isinstance(t.phase, str) and t.phase in _VALID_PHASES
+                else include_invalid
+            )
         ]
 
     # Filter by assignee if specified
@@ -416,29 +433,18 @@ async def _process_vault(
                 visible_tasks.append(t)
     tasks = visible_tasks
 
-    # Filter out blocked tasks (use cache for fast lookup)
-    cache = get_status_cache()
-    unblocked_tasks = []
-
-    for task in tasks:
-        if not task.blocked_by:
-            unblocked_tasks.append(task)
-            continue
-
-        has_uncompleted_blocker = False
-        for blocker_wikilink in task.blocked_by:
-            blocker_name = blocker_wikilink.strip("[]").strip()
-            blocker_status = cache.get_status(vault_config.name, blocker_name)
-            if blocker_status is None:
-                continue
-            if blocker_status != "completed":
-                has_uncompleted_blocker = True
-                break
-
-        if not has_uncompleted_blocker:
-            unblocked_tasks.append(task)
-
-    tasks = unblocked_tasks
+    # Filter out blocked tasks (use cache for fast lookup). Blockers with no
+    # cached status (unknown item) do not block.
+    vault_statuses = get_status_cache().get_vault_statuses(vault_config.name)
+    tasks = [
+        task
+        for task in tasks
+        if not task.blocked_by
+        or all(
+            vault_statuses.get(blocker.strip("[]").strip(), "completed") == "completed"
+            for blocker in task.blocked_by
+        )
+    ]
 
     # Convert to response models
     return [_task_to_response(task, vault_config) for task in tasks]
@@ -514,26 +520,26 @@ async def list_tasks(
     return all_tasks
 
 
-def _goal_to_response(goal: Goal, vault_config: VaultConfig) -> GoalResponse:
-    """Convert Goal to GoalResponse.
+def _goals_folder(vault_config: VaultConfig) -> str:
+    """Return the name of the vault's goals folder.
 
-    Builds the obsidian_url the same way ``_task_to_response`` does (line
-    894): ``obsidian://open?vault=<quote(vault_name)>&file=<quote(goals_path)>``.
-    The goals folder name is discovered from the vault's parent directory
-    using the same suffix match the cache uses (``*Goals``).
+    Goal files live under a *Goals folder in the vault root; spec 013 keeps
+    the existing folder-naming convention — the goals folder name is
+    whatever the user has in their vault (e.g. "23 Goals", "37 Goals").
+    Falls back to the standard "23 Goals" when none is found.
     """
-    # Goal files live under a *Goals folder in the vault root.
-    # Use the configured tasks_folder's parent (the vault root) and the
-    # standard "23 Goals" suffix; spec 013 keeps the existing
-    # folder-naming convention — the goals folder name is whatever the
-    # user has in their vault (e.g. "23 Goals", "37 Goals").
-    from vault_ui.hierarchy import discover_hierarchy_folders
-
     vault_root = Path(vault_config.vault_path)
     goals_folders = [f for f in discover_hierarchy_folders(vault_root) if f.name.endswith("Goals")]
-    goals_folder = goals_folders[0].name if goals_folders else "23 Goals"
-    file_path = f"{goals_folder}/{goal.id}.md"
-    obsidian_url = f"obsidian://open?vault={quote(vault_config.vault_name)}&file={quote(file_path)}"
+    return goals_folders[0].name if goals_folders else "23 Goals"
+
+
+def _goal_to_response(goal: Goal, vault_config: VaultConfig, url_prefix: str) -> GoalResponse:
+    """Convert Goal to GoalResponse.
+
+    ``url_prefix`` is ``obsidian_url_prefix(vault_config.vault_name, _goals_folder(...))``,
+    computed once per vault by the caller (the folder lookup is a directory scan).
+    """
+    obsidian_url = f"{url_prefix}{quote(goal.id)}.md"
 
     return GoalResponse(
         id=goal.id,
@@ -593,7 +599,8 @@ async def _process_goal_vault(
             )
         ]
 
-    return [_goal_to_response(g, vault_config) for g in goals]
+    url_prefix = obsidian_url_prefix(vault_config.vault_name, _goals_folder(vault_config))
+    return [_goal_to_response(g, vault_config, url_prefix) for g in goals]
 
 
 @router.get("/goals", response_model=list[GoalResponse])
@@ -661,7 +668,7 @@ async def run_task(
     Raises:
         HTTPException: If task not found or session creation fails
     """
-    logger.info(f"run_task called: vault={vault}, task_id={task_id}")
+    started = time.monotonic()
 
     try:
         client = get_vault_cli_client_for_vault(vault)
@@ -670,14 +677,20 @@ async def run_task(
         # Read task
         task = await client.show_task(task_id)
 
-        logger.info(f"Starting vault-cli session for task {task_id}")
         session_id = await start_vault_cli_session(vault_config, task_id)
-        logger.info(f"Session {session_id} created")
 
         # Build command: use vault-specific script from config (handles cd internally)
         command = _build_resume_command(vault_config, session_id, task_title=task.title)
 
-        logger.info(f"Returning session response: session_id={session_id}, command={command}")
+        # One summary record per request instead of a log line per step
+        logger.info(
+            "run_task done: vault=%s task_id=%s session_id=%s command=%s duration_ms=%d",
+            vault,
+            task_id,
+            session_id,
+            command,
+            (time.monotonic() - started) * 1000,
+        )
 
         return SessionResponse(
             session_id=session_id,
@@ -687,10 +700,18 @@ async def run_task(
         )
 
     except FileNotFoundError as e:
-        logger.error(f"Task not found: {e}")
+        logger.error("Task not found: vault=%s task_id=%s: %s", vault, task_id, e)
         raise HTTPException(status_code=404, detail=str(e)) from e
     except Exception as e:
-        logger.exception(f"Error creating session: {e}")
+        # Format the traceback only when debugging; it is costly under error bursts
+        logger.error(
+            "Error creating session: vault=%s task_id=%s: %s: %s",
+            vault,
+            task_id,
+            type(e).__name__,
+            e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -710,9 +731,7 @@ async def execute_slash_command(
     Returns:
         Session information with resume command
     """
-    logger.info(
-        f"execute_slash_command: vault={vault}, task_id={task_id}, command={request.command}"
-    )
+    started = time.monotonic()
 
     try:
         client = get_vault_cli_client_for_vault(vault)
@@ -770,7 +789,15 @@ async def execute_slash_command(
                 )
 
             command_str = " ".join(vault_cli_args)
-            logger.info(f"vault-cli fast path completed: {command_str}")
+            logger.info(
+                "execute_slash_command done: vault=%s task_id=%s command=%s "
+                "vault_cli=%r duration_ms=%d",
+                vault,
+                task_id,
+                request.command,
+                command_str,
+                (time.monotonic() - started) * 1000,
+            )
             return SessionResponse(
                 session_id="",
                 command=command_str,
@@ -783,13 +810,21 @@ async def execute_slash_command(
         if request.command not in ("work-on-task", "create-task"):
             raise HTTPException(status_code=400, detail=f"Unknown command: {request.command}")
 
-        logger.info(f"Starting vault-cli session for {request.command} on task {task_id}")
         session_id = await start_vault_cli_session(vault_config, task_id)
-        logger.info(f"Session {session_id} created via vault-cli")
 
         # Build resume command
         command = _build_resume_command(vault_config, session_id, task_title=task.title)
 
+        logger.info(
+            "execute_slash_command done: vault=%s task_id=%s command=%s session_id=%s "
+            "duration_ms=%d",
+            vault,
+            task_id,
+            request.command,
+            session_id,
+            (time.monotonic() - started) * 1000,
+        )
+
         return SessionResponse(
             session_id=session_id,
             command=command,
@@ -797,13 +832,37 @@ async def execute_slash_command(
             task_title=task.title,
         )
 
-    except HTTPException:
+    except HTTPException as e:
+        logger.log(
+            logging.ERROR if e.status_code >= 500 else logging.WARNING,
+            "execute_slash_command failed: vault=%s task_id=%s command=%s status=%d detail=%s",
+            vault,
+            task_id,
+            request.command,
+            e.status_code,
+            e.detail,
+        )
         raise
     except FileNotFoundError as e:
-        logger.error(f"Task not found: {e}")
+        logger.error(
+            "Task not found: vault=%s task_id=%s command=%s: %s",
+            vault,
+            task_id,
+            request.command,
+            e,
+        )
         raise HTTPException(status_code=404, detail=str(e)) from e
     except Exception as e:
-        logger.exception(f"Error executing command: {e}")
+        # Format the traceback only when debugging; it is costly under error bursts
+        logger.error(
+            "Error executing command: vault=%s task_id=%s command=%s: %s: %s",
+            vault,
+            task_id,
+            request.command,
+            type(e).__name__,
+            e,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
@@ -1132,7 +1191,9 @@ async def set_task_session(
         if is_uuid(request.claude_session_id):
             stored_value = request.claude_session_id
         else:
-            resolved = resolve_session_id(
+            # resolve_session_id scans .jsonl files on disk — keep it off the event loop
+            resolved = await asyncio.to_thread(
+                resolve_session_id,
                 request.claude_session_id,
                 derive_claude_project_dir(
                     vault_config.vault_path, vault_config.session_project_dir
@@ -1171,29 +1232,33 @@ async def reload_cache(vault: str | None = None) -> dict[str, list[str] | dict[s
             raise HTTPException(status_code=404, detail=f"Unknown vault: {vault}")
 
         vault_path = Path(vault_config.vault_path)
-        cache.load_vault(vault, vault_path, vault_config.tasks_folder)
+        await asyncio.to_thread(cache.load_vault, vault, vault_path, vault_config.tasks_folder)
         count = cache.count(vault)
         return {"reloaded": [vault], "counts": {vault: count}}
 
-    # Reload all vaults
-    reloaded = []
-    counts = {}
-    for vault_config in config.vaults:
-        vault_path = Path(vault_config.vault_path)
-        cache.load_vault(vault_config.name, vault_path, vault_config.tasks_folder)
-        count = cache.count(vault_config.name)
-        reloaded.append(vault_config.name)
-        counts[vault_config.name] = count
+    # Reload all vaults; each load_vault walks its own vault, so the scans overlap
+    await asyncio.gather(
+        *[
+            asyncio.to_thread(cache.load_vault, v.name, Path(v.vault_path), v.tasks_folder)
+            for v in config.vaults
+        ]
+    )
+    reloaded = [v.name for v in config.vaults]
+    counts = {name: cache.count(name) for name in reloaded}
 
     return {"reloaded": reloaded, "counts": counts}
 
 
 def _task_to_response(task: Task, vault_config: VaultConfig) -> TaskResponse:
-    """Convert Task to TaskResponse."""
-    # Build Obsidian URL
-    # Format: obsidian://open?vault=VaultName&file=Path/To/File.md
-    file_path = f"{vault_config.tasks_folder}/{task.id}.md"
-    obsidian_url = f"obsidian://open?vault={quote(vault_config.vault_name)}&file={quote(file_path)}"
+    """Convert Task to TaskResponse.
+
+    The obsidian:// prefix for the tasks folder is precomputed on VaultConfig.
+
+    Builds the model with full validation: frontmatter values are passed through
+    from vault-cli untyped, and FastAPI does not re-validate a returned model
+    instance, so this is the only type check they get.
+    """
+    obsidian_url = f"{vault_config.obsidian_url_prefix}{quote(task.id)}.md"
 
     return TaskResponse(
         id=task.id,
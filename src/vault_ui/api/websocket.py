@@ -43,7 +43,7 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         while True:
             # Keep connection alive, handle client messages (ping/pong)
             data = await websocket.receive_text()
-            logger.debug(f"[WebSocket] Received from client: {data}")
+            logger.debug("[WebSocket] Received from client: %s", data)
 
             # Echo back for now (can be used for ping/pong)
             if data == "ping":
@@ -139,7 +139,9 @@ async def cleanup_stale_sessions(config: Config) -> int:
                         continue
 
                     if not is_uuid(session_id):
-                        resolved = resolve_session_id(session_id, project_dir)
+                        resolved = await asyncio.to_thread(
+                            resolve_session_id, session_id, project_dir
+                        )
                         if resolved is not None:
                             try:
                                 set_args = [
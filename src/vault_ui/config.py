@@ -5,13 +5,25 @@ import logging
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
+from urllib.parse import quote
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def obsidian_url_prefix(vault_name: str, folder: str) -> str:
+    """Build the obsidian:// URL for a vault folder, up to (excluding) the file name.
+
+    Format: ``obsidian://open?vault=VaultName&file=Folder/`` — callers append
+    ``quote(item_id)`` and ``.md``. ``quote`` encodes character by character
+    and keeps ``/`` unescaped, so encoding the vault and folder once yields
+    the same URL as encoding the full file path per item.
+    """
+    return f"obsidian://open?vault={quote(vault_name)}&file={quote(folder)}/"
+
+
+@dataclass(slots=True, frozen=True)
 class VaultConfig:
     """Configuration for a single Obsidian vault."""
 
@@ -22,6 +34,14 @@ class VaultConfig:
     claude_script: str = "claude"  # Script to run Claude sessions (default: "claude")
     vault_cli_path: str = "vault-cli"  # Path to vault-cli binary
     session_project_dir: str = ""  # Override Claude project dir for session file lookup
+    # obsidian:// URL up to the task file name, derived once from vault_name/tasks_folder
+    obsidian_url_prefix: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # frozen: derived fields are set through object.__setattr__
+        object.__setattr__(
+            self, "obsidian_url_prefix", obsidian_url_prefix(self.vault_name, self.tasks_folder)
+        )
 
 
 @dataclass
@@ -32,13 +52,17 @@ class Config:
     host: str = "127.0.0.1"
     port: int = 8000
     current_user: str = ""
+    # name → vault index built once; vaults are not mutated after construction
+    _vaults_by_name: dict[str, VaultConfig] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._vaults_by_name = {}
+        for vault in self.vaults:
+            self._vaults_by_name.setdefault(vault.name, vault)  # first match wins
 
     def get_vault(self, name: str) -> VaultConfig | None:
         """Get vault config by name."""
-        for vault in self.vaults:
-            if vault.name == name:
-                return vault
-        return None
+        return self._vaults_by_name.get(name)
 
 
 _CONFIG_PATH = Path(__file__).parent.parent.parent / "config.yaml"
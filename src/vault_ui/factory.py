@@ -1,10 +1,13 @@
 """Dependency injection factory."""
 
 import asyncio
+import functools
 import logging
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, suppress
 from pathlib import Path
+from typing import Any
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
@@ -12,6 +15,7 @@ from fastapi.staticfiles import StaticFiles
 from vault_ui.api.models import Goal, Task
 from vault_ui.cleanup import derive_claude_project_dir, run_cleanup_loop
 from vault_ui.config import Config, VaultConfig, load_config
+from vault_ui.session_resolver import is_uuid, resolve_session_id
 from vault_ui.status_cache import StatusCache
 from vault_ui.vault_cli_client import VaultCLIClient
 from vault_ui.vault_cli_watcher import VaultCLIWatcher
@@ -19,6 +23,10 @@ from vault_ui.websocket.connection_manager import ConnectionManager
 
 logger = logging.getLogger(__name__)
 
+# Bundled frontend directory, resolved once at import (None if not shipped)
+_STATIC_PATH = Path(__file__).parent / "static"
+_STATIC_DIR: str | None = str(_STATIC_PATH) if _STATIC_PATH.is_dir() else None
+
 # Global config instance for dependency injection
 _config: Config | None = None
 
@@ -28,6 +36,44 @@ _watchers: dict[str, VaultCLIWatcher] = {}
 _watcher_tasks: list[asyncio.Task[None]] = []
 _status_cache: StatusCache | None = None
 _cleanup_task: asyncio.Task[None] | None = None
+# Fire-and-forget tasks spawned by watcher callbacks, kept referenced until done
+_background_tasks: set[asyncio.Task[None]] = set()
+# Watcher-driven StatusCache re-reads; a single worker applies them in event order
+_INVALIDATE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="status-invalidate")
+
+
+def _spawn(loop: asyncio.AbstractEventLoop, coro: Coroutine[Any, Any, None]) -> None:
+    """Schedule coro on loop without waiting for it.
+
+    Watcher callbacks already run on the event loop thread, so a plain task is
+    enough; run_coroutine_threadsafe would add a concurrent Future and a
+    thread-safe wakeup per call for nothing. The task starts eagerly, so a
+    broadcast with no connected clients finishes inside the callback without a
+    scheduler round trip. Only these tasks are eager; the loop's task factory
+    is left alone.
+    """
+    task = asyncio.Task(coro, loop=loop, eager_start=True)
+    if task.done():
+        return
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _invalidate_then_broadcast(
+    cache: StatusCache,
+    connection_manager: ConnectionManager,
+    vault_name: str,
+    item_id: str,
+    message: dict[str, Any],
+) -> None:
+    """Re-read an item's status off the event loop, then notify clients.
+
+    Broadcasting only after the re-read means clients that refetch on the
+    event already see the new status.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_INVALIDATE_EXECUTOR, cache.invalidate, vault_name, item_id)
+    await connection_manager.broadcast(message)
 
 
 def get_config() -> Config:
@@ -38,13 +84,21 @@ def get_config() -> Config:
     return _config
 
 
+@functools.lru_cache(maxsize=32)
+def _get_vault_cli_client(vault_cli_path: str, vault_name: str) -> VaultCLIClient:
+    """Get the shared VaultCLIClient for a (binary, vault) pair.
+
+    VaultCLIClient is stateless beyond these two values, so one instance per
+    pair is reused for the process lifetime. Keying on the values (not the
+    vault name alone) keeps the cache correct when the config is swapped.
+    """
+    return VaultCLIClient(vault_cli_path, vault_name)
+
+
 def get_vault_cli_client_for_vault(vault_name: str) -> VaultCLIClient:
-    """Create VaultCLIClient for specific vault."""
-    config = get_config()
-    vault = config.get_vault(vault_name)
-    if not vault:
-        raise ValueError(f"Unknown vault: {vault_name}")
-    return VaultCLIClient(vault.vault_cli_path, vault.name)
+    """Get VaultCLIClient for specific vault."""
+    vault = get_vault_config(vault_name)
+    return _get_vault_cli_client(vault.vault_cli_path, vault.name)
 
 
 def get_vault_config(vault_name: str) -> VaultConfig:
@@ -83,15 +137,13 @@ async def _try_resolve_task_session(
     Called from the watcher callback after a file change event.
     Silently no-ops if the task has no session ID or it is already a UUID.
     """
-    from vault_ui.session_resolver import is_uuid, resolve_session_id
-
     try:
-        client = VaultCLIClient(vault_cli_path, vault_name)
+        client = _get_vault_cli_client(vault_cli_path, vault_name)
         task = await client.show_task(task_id)
         session_id = task.claude_session_id
         if not session_id or is_uuid(session_id):
             return
-        resolved = resolve_session_id(session_id, project_dir)
+        resolved = await asyncio.to_thread(resolve_session_id, session_id, project_dir)
         if resolved is None:
             logger.debug(
                 "[Factory] No resolution found for display name '%s' on task %s",
@@ -123,10 +175,8 @@ async def _try_resolve_goal_session(
     the goal cannot be found, or the display name does not resolve to any
     on-disk session file.
     """
-    from vault_ui.session_resolver import is_uuid, resolve_session_id
-
     try:
-        client = VaultCLIClient(vault_cli_path, vault_name)
+        client = _get_vault_cli_client(vault_cli_path, vault_name)
         goals = await client.list_goals(show_all=True)
         goal = next((g for g in goals if g.id == goal_id), None)
         if goal is None:
@@ -139,7 +189,7 @@ async def _try_resolve_goal_session(
         session_id = goal.claude_session_id
         if not session_id or is_uuid(session_id):
             return
-        resolved = resolve_session_id(session_id, project_dir)
+        resolved = await asyncio.to_thread(resolve_session_id, session_id, project_dir)
         if resolved is None:
             logger.debug(
                 "[Factory] No resolution found for display name '%s' on goal %s",
@@ -193,11 +243,6 @@ def start_task_watchers(
                 )
 
                 def callback(event_type: str, item_id: str, vault_arg: str, item_kind: str) -> None:
-                    # Invalidate cache (unconditional — kind-agnostic; the cache stores
-                    # blocker statuses keyed by name, and any frontmatter change can
-                    # invalidate a downstream task that lists this item as a blocker)
-                    cache.invalidate(vault_arg, item_id)
-
                     # Kind-scoped cache invalidation (spec 013 AC#9):
                     # only the cache matching the event's kind is touched.
                     # The other view's cache stays so the inactive view
@@ -229,22 +274,31 @@ def start_task_watchers(
                         "vault": vault_arg,
                         "item_kind": item_kind,
                     }
-                    asyncio.run_coroutine_threadsafe(connection_manager.broadcast(message), loop)
+                    # Invalidate the status cache first (unconditional — kind-agnostic;
+                    # the cache stores blocker statuses keyed by name, and any frontmatter
+                    # change can invalidate a downstream task that lists this item as a
+                    # blocker). The file read runs off the event loop.
+                    _spawn(
+                        loop,
+                        _invalidate_then_broadcast(
+                            cache, connection_manager, vault_arg, item_id, message
+                        ),
+                    )
 
                     # Dispatch session resolution based on the file's kind
                     if item_kind == "task":
-                        asyncio.run_coroutine_threadsafe(
+                        _spawn(
+                            loop,
                             _try_resolve_task_session(
                                 vault_cfg.vault_cli_path, vault_cfg.name, item_id, project_dir
                             ),
-                            loop,
                         )
                     elif item_kind == "goal":
-                        asyncio.run_coroutine_threadsafe(
+                        _spawn(
+                            loop,
                             _try_resolve_goal_session(
                                 vault_cfg.vault_cli_path, vault_cfg.name, item_id, project_dir
                             ),
-                            loop,
                         )
                     else:
                         # theme, objective, empty string, or any future kind: no resolver
@@ -300,13 +354,19 @@ def stop_task_watchers() -> None:
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Manage application lifecycle - startup and shutdown."""
     global _cleanup_task
+
     # Populate status cache before starting watchers
     logger.info("[Lifespan] Loading status cache...")
     cache = get_status_cache()
     config = get_config()
-    for vault in config.vaults:
-        vault_path = Path(vault.vault_path)
-        cache.load_vault(vault.name, vault_path, vault.tasks_folder)
+    # Vault loads are independent file scans; overlap them off the event loop.
+    # StatusCache only swaps in each vault's finished dict, keyed per vault.
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(cache.load_vault, v.name, Path(v.vault_path), v.tasks_folder)
+            for v in config.vaults
+        )
+    )
 
     logger.info("[Lifespan] Starting task watchers...")
     start_task_watchers(app.state.vault_task_cache, app.state.vault_goal_cache)
@@ -349,8 +409,9 @@ def create_app() -> FastAPI:
     app.include_router(ws_router)  # WebSocket at /ws
 
     # Mount static files (HTML/CSS/JS)
-    static_dir = Path(__file__).parent / "static"
-    if static_dir.exists():
-        app.mount("/", StaticFiles(directory=str(static_dir), html=True), name="static")
+    if _STATIC_DIR is not None:
+        app.mount(
+            "/", StaticFiles(directory=_STATIC_DIR, html=True, check_dir=False), name="static"
+        )
 
     return app
@@ -3,6 +3,7 @@
 from pathlib import Path
 
 HIERARCHY_SUFFIXES = ("Themes", "Objectives", "Goals", "Tasks")
+_CATEGORY_ORDER = {suffix: idx for idx, suffix in enumerate(HIERARCHY_SUFFIXES)}
 
 
 def discover_hierarchy_folders(vault_path: Path) -> list[Path]:
@@ -28,8 +29,6 @@ def discover_hierarchy_folders(vault_path: Path) -> list[Path]:
         if entry.is_dir() and any(entry.name.endswith(suffix) for suffix in HIERARCHY_SUFFIXES)
     ]
 
-    category_order = {suffix: idx for idx, suffix in enumerate(HIERARCHY_SUFFIXES)}
-
     def _sort_key(path: Path) -> tuple[int, int, str]:
         name = path.name
         suffix = next((s for s in HIERARCHY_SUFFIXES if name.endswith(s)), "")
@@ -39,7 +38,7 @@ def discover_hierarchy_folders(vault_path: Path) -> list[Path]:
         except ValueError:
             numeric_prefix = 9999
 
-        return (category_order.get(suffix, 9999), numeric_prefix, name.lower())
+        return (_CATEGORY_ORDER.get(suffix, 9999), numeric_prefix, name.lower())
 
     return sorted(folders, key=_sort_key)
 
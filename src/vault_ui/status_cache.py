@@ -1,8 +1,13 @@
 """In-memory cache for task/goal/theme statuses."""
 
 import logging
+import os
 import re
+import threading
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 import yaml
 
@@ -10,15 +15,97 @@ from vault_ui.hierarchy import discover_hierarchy_folders_for_vault
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it; same safe tag set, much faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# A plain YAML scalar that PyYAML resolves to the same string (no bool/null/number)
+_PLAIN_STATUS_RE = re.compile(rb"[A-Za-z][A-Za-z0-9_-]*")
+_YAML_NON_STRINGS = frozenset({b"yes", b"no", b"true", b"false", b"on", b"off", b"null"})
+
+# Upper bound on frontmatter size read while looking for the closing delimiter
+_MAX_FRONTMATTER_BYTES = 64 * 1024
+
+# Shared pool for per-file status extraction; threads start lazily and are reused
+# across vault loads. File reads release the GIL, so a bounded pool overlaps I/O.
+_PARSE_POOL = ThreadPoolExecutor(
+    max_workers=min(16, (os.cpu_count() or 1) * 4), thread_name_prefix="status-cache"
+)
+
+
+def _scan_status(lines: list[bytes]) -> str | None:
+    """Pick a simple top-level ``status: value`` line without running YAML.
+
+    Returns None whenever the value is not a plain or quoted single-word
+    scalar (or the key is missing/repeated), so callers fall back to the
+    full YAML parse and keep its semantics for anything unusual.
+    """
+    found: bytes | None = None
+    for i, line in enumerate(lines):
+        if not line.startswith(b"status:") or line[7:8] not in (b" ", b"\t", b"\r", b"\n"):
+            continue
+        if found is not None:
+            return None  # duplicate key; YAML decides
+        if i + 1 < len(lines) and lines[i + 1][:1] in (b" ", b"\t"):
+            return None  # possible multi-line value
+        found = line[7:].split(b" #", 1)[0].strip()
+    if not found:
+        return None
+    if found[:1] in (b"'", b'"') and found[-1:] == found[:1]:
+        inner = found[1:-1]
+        return inner.decode("utf-8") if _PLAIN_STATUS_RE.fullmatch(inner) else None
+    if _PLAIN_STATUS_RE.fullmatch(found) and found.lower() not in _YAML_NON_STRINGS:
+        return found.decode("utf-8")
+    return None
+
+
+_FileMeta = tuple[int, int, str | None]
+# Shared read-only result for lookups against a vault that is not loaded
+_EMPTY: Mapping[str, str] = MappingProxyType({})
+
+
+def _iter_md_files(root: str) -> Iterator[os.DirEntry[str]]:
+    """Yield ``*.md`` files under root in a deterministic pre-order walk.
+
+    Each directory yields its own files first, then descends into each
+    subdirectory in turn, all sorted by name. Unlike rglob (whose order
+    depends on the Python version and on readdir order), this makes the
+    duplicate item ID rule in load_vault stable. Walks with os.scandir so
+    directory entries come straight from readdir instead of building a Path
+    per entry. Symlinked directories are not descended into; symlinked files
+    are included.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.endswith(".md") and entry.is_file():
+            yield entry
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_md_files(entry.path)
+
 
 class StatusCache:
     """In-memory cache of task/goal/theme statuses for fast blocker resolution."""
 
     def __init__(self) -> None:
         """Initialize empty cache."""
+        # vault → {item_id: status}. Published dicts are never mutated: writers
+        # build a new dict and swap it in, so readers always see a stable snapshot
         self._cache: dict[str, dict[str, str]] = {}
         self._vault_paths: dict[str, Path] = {}
         self._tasks_folders: dict[str, str] = {}
+        # vault → {path: (mtime_ns, size, status)} from the last load, for skipping
+        # unchanged files on reload
+        self._file_meta: dict[str, dict[str, _FileMeta]] = {}
+        # vault → {item_id: file path}, so invalidate() can stat one known file
+        self._item_paths: dict[str, dict[str, str]] = {}
+        # Per-vault locks serializing the load_vault swap with invalidate() writes
+        self._locks: dict[str, threading.Lock] = {}
+        # vault → one set per running load_vault of item IDs invalidated meanwhile
+        self._loads_in_progress: dict[str, list[set[str]]] = {}
 
     def load_vault(
         self, vault_name: str, vault_path: Path, tasks_folder: str | None = None
@@ -33,6 +120,12 @@ class StatusCache:
             tasks_folder: Preferred tasks folder name for this vault
         """
         cache: dict[str, str] = {}  # Start fresh each time
+        lock = self._lock_for(vault_name)
+        # Items invalidated while this load walks the vault; their fresher
+        # invalidate() result is carried over instead of the walk's snapshot
+        touched: set[str] = set()
+        with lock:
+            self._loads_in_progress.setdefault(vault_name, []).append(touched)
 
         # Scan discovered hierarchy folders for items with status
         hierarchy_folders = discover_hierarchy_folders_for_vault(
@@ -41,20 +134,69 @@ class StatusCache:
         if not hierarchy_folders:
             logger.info(f"[StatusCache] No hierarchy folders found in: {vault_path}")
 
-        for folder_path in hierarchy_folders:
-            for md_file in folder_path.rglob("*.md"):
-                item_id = md_file.stem
-                status = self._extract_status(md_file)
-                if status:
-                    cache[item_id] = status
+        md_files = [md for folder in hierarchy_folders for md in _iter_md_files(str(folder))]
+        known = self._file_meta.get(vault_name, {})
+        file_meta: dict[str, _FileMeta] = {}
+        item_paths: dict[str, str] = {}
+        # map() keeps input order. On duplicate item IDs the last file wins: later
+        # hierarchy folders over earlier ones, and within a folder the walk order
+        # of _iter_md_files (a directory's files before its subdirectories,
+        # siblings by name).
+        for md_file, meta in zip(
+            md_files,
+            _PARSE_POOL.map(lambda entry: self._load_file(entry, known), md_files),
+            strict=True,
+        ):
+            if meta is None:
+                continue
+            item_id = md_file.name[:-3]
+            file_meta[md_file.path] = meta
+            item_paths[item_id] = md_file.path
+            if meta[2]:
+                cache[item_id] = meta[2]
 
-        # Atomic replacement (overwrites previous cache)
-        self._cache[vault_name] = cache
-        self._vault_paths[vault_name] = vault_path
-        if tasks_folder is not None:
-            self._tasks_folders[vault_name] = tasks_folder
+        with lock:
+            self._loads_in_progress[vault_name].remove(touched)
+            live_cache = self._cache.get(vault_name, {})
+            live_paths = self._item_paths.get(vault_name, {})
+            for item_id in touched:
+                stale_path = item_paths.pop(item_id, None)
+                if stale_path is not None:
+                    # Force a re-read on the next load rather than trusting the walk
+                    file_meta.pop(stale_path, None)
+                if item_id in live_paths:
+                    item_paths[item_id] = live_paths[item_id]
+                if item_id in live_cache:
+                    cache[item_id] = live_cache[item_id]
+                else:
+                    cache.pop(item_id, None)
+
+            # Atomic replacement (overwrites previous cache); paths gone from disk drop out
+            self._cache[vault_name] = cache
+            self._file_meta[vault_name] = file_meta
+            self._item_paths[vault_name] = item_paths
+            self._vault_paths[vault_name] = vault_path
+            if tasks_folder is not None:
+                self._tasks_folders[vault_name] = tasks_folder
         logger.info(f"[StatusCache] Loaded {len(cache)} items for vault '{vault_name}'")
 
+    def _load_file(
+        self, entry: os.DirEntry[str], known: Mapping[str, _FileMeta]
+    ) -> _FileMeta | None:
+        """Return (mtime_ns, size, status) for a file, reusing the last load's status.
+
+        The file is only re-read when its mtime or size changed since the
+        previous load_vault. Returns None if the file vanished mid-scan.
+        """
+        try:
+            st = entry.stat()
+        except OSError:
+            return None
+        previous = known.get(entry.path)
+        if previous is not None and previous[0] == st.st_mtime_ns and previous[1] == st.st_size:
+            return previous
+        return (st.st_mtime_ns, st.st_size, self._extract_status(Path(entry.path)))
+
     def _extract_status(self, file_path: Path) -> str | None:
         """Fast status extraction from frontmatter.
 
@@ -65,15 +207,32 @@ class StatusCache:
             Status string if found, None otherwise
         """
         try:
-            content = file_path.read_text(encoding="utf-8")
-            match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-            if match:
-                frontmatter = yaml.safe_load(match.group(1))
-                if isinstance(frontmatter, dict):
-                    return frontmatter.get("status")
+            # Read raw lines up to the closing delimiter; the body is never loaded and
+            # only the frontmatter bytes are decoded
+            with file_path.open("rb") as fh:
+                if fh.readline(_MAX_FRONTMATTER_BYTES).rstrip() != b"---":
+                    return None
+                lines: list[bytes] = []
+                remaining = _MAX_FRONTMATTER_BYTES
+                while True:
+                    line = fh.readline(remaining + 1)
+                    if not line:
+                        return None  # unterminated frontmatter
+                    if line.startswith(b"---"):
+                        break
+                    remaining -= len(line)
+                    if remaining < 0:
+                        return None  # oversized; not a frontmatter block we parse
+                    lines.append(line)
+            status = _scan_status(lines)
+            if status is not None:
+                return status
+            frontmatter = yaml.load(b"".join(lines).decode("utf-8"), Loader=_YAML_LOADER)
+            if isinstance(frontmatter, dict):
+                return frontmatter.get("status")
             return None
         except Exception as e:
-            logger.debug(f"[StatusCache] Failed to extract status from {file_path.name}: {e}")
+            logger.debug("[StatusCache] Failed to extract status from %s: %s", file_path.name, e)
             return None
 
     def get_status(self, vault_name: str, item_id: str) -> str | None:
@@ -86,7 +245,24 @@ class StatusCache:
         Returns:
             Status string if found, None otherwise
         """
-        return self._cache.get(vault_name, {}).get(item_id)
+        return self._cache.get(vault_name, _EMPTY).get(item_id)
+
+    def get_vault_statuses(self, vault_name: str) -> Mapping[str, str]:
+        """Get a read-only snapshot of the item_id → status mapping for a vault.
+
+        Lets hot loops resolve many items with plain ``dict.get`` calls instead
+        of one ``get_status`` method call per lookup. Later invalidations and
+        reloads publish a new dict, so the snapshot never changes under a
+        caller, even while it iterates.
+
+        Args:
+            vault_name: Name of the vault
+
+        Returns:
+            Mapping of item ID to status, empty if vault not loaded
+        """
+        cache = self._cache.get(vault_name)
+        return _EMPTY if cache is None else MappingProxyType(cache)
 
     def count(self, vault_name: str) -> int:
         """Get number of cached items for a vault.
@@ -97,7 +273,7 @@ class StatusCache:
         Returns:
             Number of cached items, 0 if vault not loaded
         """
-        return len(self._cache.get(vault_name, {}))
+        return len(self._cache.get(vault_name, _EMPTY))
 
     def invalidate(self, vault_name: str, item_id: str) -> None:
         """Invalidate single item - reload from disk.
@@ -113,24 +289,54 @@ class StatusCache:
             logger.warning(f"[StatusCache] Unknown vault for invalidation: {vault_name}")
             return
 
-        # Search for file in discovered hierarchy folders
+        # Disk reads happen outside the lock; only the cache writes are serialized
+        md_file = self._find_item_file(vault_name, vault_path, item_id)
+        status = self._extract_status(md_file) if md_file is not None else None
+
+        with self._lock_for(vault_name):
+            for touched in self._loads_in_progress.get(vault_name, ()):
+                touched.add(item_id)
+            item_paths = self._item_paths.setdefault(vault_name, {})
+            # Copy-on-write so snapshots handed out by get_vault_statuses stay fixed
+            cache = dict(self._cache.get(vault_name, {}))
+            if md_file is None:
+                # File deleted or moved - remove from cache
+                item_paths.pop(item_id, None)
+                cache.pop(item_id, None)
+                logger.debug("[StatusCache] Removed '%s' (file not found)", item_id)
+            else:
+                item_paths[item_id] = str(md_file)
+                if status:
+                    cache[item_id] = status
+                    logger.debug("[StatusCache] Updated '%s' → status: %s", item_id, status)
+                else:
+                    # Status field removed or invalid - remove from cache
+                    cache.pop(item_id, None)
+                    logger.debug("[StatusCache] Removed '%s' (no valid status)", item_id)
+            self._cache[vault_name] = cache
+
+    def _lock_for(self, vault_name: str) -> threading.Lock:
+        """Return the lock guarding vault_name's cache writes (created on first use)."""
+        lock = self._locks.get(vault_name)
+        if lock is None:
+            # setdefault is atomic, so racing first callers share one lock
+            lock = self._locks.setdefault(vault_name, threading.Lock())
+        return lock
+
+    def _find_item_file(self, vault_name: str, vault_path: Path, item_id: str) -> Path | None:
+        """Locate an item's markdown file, trying its last known path first.
+
+        Falls back to probing each discovered hierarchy folder for new or
+        moved files. invalidate() records the result for the next lookup.
+        """
+        known = self._item_paths.get(vault_name, {}).get(item_id)
+        if known is not None and os.path.isfile(known):
+            return Path(known)
+
         tasks_folder = self._tasks_folders.get(vault_name, "24 Tasks")
         for folder_path in discover_hierarchy_folders_for_vault(vault_path, tasks_folder):
             md_file = folder_path / f"{item_id}.md"
             if md_file.exists():
-                status = self._extract_status(md_file)
-                if status:
-                    if vault_name not in self._cache:
-                        self._cache[vault_name] = {}
-                    self._cache[vault_name][item_id] = status
-                    logger.debug(f"[StatusCache] Updated '{item_id}' → status: {status}")
-                else:
-                    # Status field removed or invalid - remove from cache
-                    self._cache.get(vault_name, {}).pop(item_id, None)
-                    logger.debug(f"[StatusCache] Removed '{item_id}' (no valid status)")
-                return
-
-        # File deleted or moved - remove from cache
-        if vault_name in self._cache:
-            self._cache[vault_name].pop(item_id, None)
-            logger.debug(f"[StatusCache] Removed '{item_id}' (file not found)")
+                return md_file
+
+        return None
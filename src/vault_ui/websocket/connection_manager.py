@@ -1,20 +1,24 @@
 """WebSocket connection management."""
 
-import json
+import asyncio
 import logging
+from contextlib import suppress
 from typing import Any
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+_SEND_TIMEOUT_SECONDS = 1.0
+
 
 class ConnectionManager:
     """Manages active WebSocket connections and broadcasts messages."""
 
     def __init__(self) -> None:
-        """Initialize connection manager with empty connection list."""
-        self.active_connections: list[WebSocket] = []
+        """Initialize connection manager with empty connection set."""
+        self.active_connections: set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and register a new WebSocket connection.
@@ -23,19 +27,21 @@ class ConnectionManager:
             websocket: WebSocket connection to register
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"[ConnectionManager] Client connected (total: {len(self.active_connections)})")
+        self.active_connections.add(websocket)
+        logger.info(
+            "[ConnectionManager] Client connected (total: %d)", len(self.active_connections)
+        )
 
     def disconnect(self, websocket: WebSocket) -> None:
-        """Remove a WebSocket connection from active list.
+        """Remove a WebSocket connection from the active set.
 
         Args:
             websocket: WebSocket connection to remove
         """
         if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+            self.active_connections.discard(websocket)
             logger.info(
-                f"[ConnectionManager] Client disconnected (total: {len(self.active_connections)})"
+                "[ConnectionManager] Client disconnected (total: %d)", len(self.active_connections)
             )
 
     async def broadcast(self, message: dict[str, Any]) -> None:
@@ -48,24 +54,40 @@ class ConnectionManager:
             logger.debug("[ConnectionManager] No active connections to broadcast to")
             return
 
-        message_json = json.dumps(message)
+        # Serialize once; every client gets the same text frame
+        message_json = orjson.dumps(message).decode()
         # Snapshot to avoid mutation during iteration
         connections = list(self.active_connections)
-        num_clients = len(connections)
-        logger.debug(f"[ConnectionManager] Broadcasting to {num_clients} clients: {message_json}")
-
-        # Send to all connections, remove dead ones
-        dead_connections = []
-        for connection in connections:
-            try:
-                await connection.send_text(message_json)
-            except Exception as e:
-                logger.warning(f"[ConnectionManager] Failed to send to client: {e}", exc_info=True)
-                dead_connections.append(connection)
+        logger.debug(
+            "[ConnectionManager] Broadcasting to %d clients: %s", len(connections), message_json
+        )
+
+        # Send to all connections concurrently so one slow client does not delay the rest
+        results = await asyncio.gather(
+            *(self._send_text(connection, message_json) for connection in connections),
+            return_exceptions=True,
+        )
 
         # Clean up dead connections
-        for connection in dead_connections:
-            self.disconnect(connection)
+        for connection, result in zip(connections, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "[ConnectionManager] Failed to send to client: %s", result, exc_info=result
+                )
+                self.disconnect(connection)
+
+    async def _send_text(self, websocket: WebSocket, text: str) -> None:
+        """Send a text frame, giving up on clients that stall past the timeout.
+
+        A stalled client is closed so the frontend reconnects and reloads,
+        rather than silently missing updates after being dropped.
+        """
+        try:
+            await asyncio.wait_for(websocket.send_text(text), timeout=_SEND_TIMEOUT_SECONDS)
+        except TimeoutError:
+            with suppress(Exception):
+                await asyncio.wait_for(websocket.close(code=1013), timeout=_SEND_TIMEOUT_SECONDS)
+            raise
 
     async def send_personal(self, message: dict[str, Any], websocket: WebSocket) -> None:
         """Send message to specific client.
@@ -75,9 +97,9 @@ class ConnectionManager:
             websocket: Target WebSocket connection
         """
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(orjson.dumps(message).decode())
         except Exception as e:
             logger.warning(
-                f"[ConnectionManager] Failed to send personal message: {e}", exc_info=True
+                "[ConnectionManager] Failed to send personal message: %s", e, exc_info=True
             )
             self.disconnect(websocket)
@@ -286,6 +286,55 @@ def test_run_task_endpoint_success(
     assert data["task_title"] == "Test Task"
 
 
+def test_run_task_logs_single_summary_record(
+    test_client: TestClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A successful run emits one summary record instead of a log line per step."""
+    mock_proc = _make_streaming_proc(b'{"session_id": "test-session-id"}')
+    caplog.set_level(logging.DEBUG, logger="vault_ui.api.tasks")
+
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=mock_proc)):
+        response = test_client.post("/api/tasks/Test%20Task/run?vault=TestVault")
+
+    assert response.status_code == 200
+    records = [
+        r
+        for r in caplog.records
+        if r.name == "vault_ui.api.tasks" and not r.getMessage().startswith("vault-cli std")
+    ]
+    assert len(records) == 1, [r.getMessage() for r in records]
+    assert records[0].levelno == logging.INFO
+    message = records[0].getMessage()
+    assert message.startswith("run_task done:")
+    assert "task_id=Test Task" in message
+    assert "session_id=test-session-id" in message
+    assert "duration_ms=" in message
+
+
+@pytest.mark.parametrize("level,has_traceback", [(logging.INFO, False), (logging.DEBUG, True)])
+def test_run_task_error_traceback_only_at_debug(
+    test_client: TestClient,
+    caplog: pytest.LogCaptureFixture,
+    level: int,
+    has_traceback: bool,
+) -> None:
+    """Session errors log type and message; the traceback is attached only at DEBUG."""
+    caplog.set_level(level, logger="vault_ui.api.tasks")
+
+    with patch(
+        "asyncio.create_subprocess_exec", AsyncMock(side_effect=OSError("vault-cli missing"))
+    ):
+        response = test_client.post("/api/tasks/Test%20Task/run?vault=TestVault")
+
+    assert response.status_code == 500
+    errors = [r for r in caplog.records if r.levelno == logging.ERROR]
+    assert len(errors) == 1
+    assert errors[0].getMessage() == (
+        "Error creating session: vault=TestVault task_id=Test Task: OSError: vault-cli missing"
+    )
+    assert bool(errors[0].exc_info) is has_traceback
+
+
 def test_run_task_endpoint_not_found(test_client: TestClient) -> None:
     """Test POST /api/tasks/{id}/run with non-existent task."""
     response = test_client.post("/api/tasks/NonExistent/run?vault=TestVault")
@@ -387,6 +436,19 @@ async def test_start_vault_cli_session_streams_output(caplog: pytest.LogCaptureF
     assert all(d >= 0.08 for d in deltas), deltas
 
 
+async def test_start_vault_cli_session_without_session_id_raises() -> None:
+    """A result line lacking session_id surfaces vault-cli's warnings in the error."""
+    from vault_ui.api.tasks import start_vault_cli_session
+
+    proc = _make_streaming_proc(b'{"session_id": "", "warnings": ["claude not found"]}')
+
+    with (
+        patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)),
+        pytest.raises(RuntimeError, match="claude not found"),
+    ):
+        await start_vault_cli_session(_make_vault_config(), "Test Task")
+
+
 def test_list_tasks_filters_deferred(test_client: TestClient, mock_vault_client: MagicMock) -> None:
     """Test that tasks with future defer_date are filtered out."""
     from datetime import date, timedelta
@@ -696,6 +758,25 @@ def test_list_tasks_invalid_phase_treated_as_todo(
     assert "Task Invalid Phase" in task_ids
 
 
+def test_list_tasks_phase_filter_skips_unhashable_phase(
+    test_client: TestClient, mock_vault_client: MagicMock
+) -> None:
+    """A list-valued phase from raw frontmatter is treated as invalid, not a server error."""
+    mock_vault_client._tasks.append(
+        _make_task(task_id="Task List Phase", status="in_progress", phase=["in_progress"])  # type: ignore[arg-type]
+    )
+    mock_vault_client._tasks.append(
+        _make_task(task_id="Task In Progress", status="in_progress", phase="in_progress")
+    )
+
+    response = test_client.get("/api/tasks?vault=TestVault&phase=in_progress")
+    assert response.status_code == 200
+    task_ids = [t["id"] for t in response.json()]
+
+    assert "Task In Progress" in task_ids
+    assert "Task List Phase" not in task_ids
+
+
 def test_execute_defer_task_uses_vault_cli(
     test_client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
@@ -853,6 +934,44 @@ def test_execute_unknown_command_returns_400(
     assert "phase-migrate" in response.json()["detail"]
 
 
+def test_execute_command_failures_log_vault_and_task(
+    test_client: TestClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Client errors log a WARNING and vault-cli failures an ERROR, both naming the task."""
+    caplog.set_level(logging.INFO, logger="vault_ui.api.tasks")
+    test_client.post(
+        "/api/tasks/Test%20Task/execute-command?vault=TestVault",
+        json={"command": "phase-migrate"},
+    )
+    proc = AsyncMock()
+    proc.returncode = 1
+    proc.communicate = AsyncMock(return_value=(b"", b"boom"))
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+        response = test_client.post(
+            "/api/tasks/Test%20Task/execute-command?vault=TestVault",
+            json={"command": "complete-task"},
+        )
+
+    assert response.status_code == 500
+    failures = [
+        (r.levelno, r.getMessage())
+        for r in caplog.records
+        if r.getMessage().startswith("execute_slash_command failed")
+    ]
+    assert failures == [
+        (
+            logging.WARNING,
+            "execute_slash_command failed: vault=TestVault task_id=Test Task "
+            "command=phase-migrate status=400 detail=Unknown command: phase-migrate",
+        ),
+        (
+            logging.ERROR,
+            "execute_slash_command failed: vault=TestVault task_id=Test Task "
+            "command=complete-task status=500 detail=boom",
+        ),
+    ]
+
+
 def test_update_task_phase_uses_vault_cli(
     test_client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
@@ -1101,6 +1220,69 @@ def test_list_tasks_warns_on_status_phase_mismatch(
 # --- _parse_defer_date tests ---
 
 
+def test_list_tasks_filters_tasks_with_uncompleted_blockers(
+    test_client: TestClient,
+    mock_vault_client: MagicMock,
+    tmp_vault: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tasks blocked by a non-completed item are hidden; completed/unknown blockers pass."""
+    from vault_ui.status_cache import StatusCache
+
+    tasks_dir = tmp_vault / "24 Tasks"
+    (tasks_dir / "Open Blocker.md").write_text("---\nstatus: in_progress\n---\n")
+    (tasks_dir / "Done Blocker.md").write_text("---\nstatus: completed\n---\n")
+    cache = StatusCache()
+    cache.load_vault("TestVault", tmp_vault, "24 Tasks")
+    monkeypatch.setattr("vault_ui.factory._status_cache", cache)
+
+    mock_vault_client._tasks[:] = [
+        _make_task(task_id="Blocked", blocked_by=["[[Open Blocker]]"]),
+        _make_task(task_id="Unblocked", blocked_by=["[[Done Blocker]]"]),
+        _make_task(task_id="Unknown Blocker", blocked_by=["[[Missing]]"]),
+        _make_task(task_id="Mixed", blocked_by=["[[Done Blocker]]", "[[Open Blocker]]"]),
+    ]
+
+    response = test_client.get("/api/tasks?vault=TestVault")
+
+    assert response.status_code == 200
+    assert sorted(t["id"] for t in response.json()) == ["Unblocked", "Unknown Blocker"]
+
+
+def test_reload_cache_single_vault(
+    test_client: TestClient, tmp_vault: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """POST /api/cache/reload?vault= reloads that vault's statuses from disk."""
+    from vault_ui.status_cache import StatusCache
+
+    monkeypatch.setattr("vault_ui.factory._status_cache", StatusCache())
+    (tmp_vault / "24 Tasks" / "Other Task.md").write_text("---\nstatus: todo\n---\n")
+
+    response = test_client.post("/api/cache/reload?vault=TestVault")
+
+    assert response.status_code == 200
+    assert response.json() == {"reloaded": ["TestVault"], "counts": {"TestVault": 2}}
+
+
+def test_reload_cache_all_vaults(test_client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """POST /api/cache/reload without a vault reloads every configured vault."""
+    from vault_ui.status_cache import StatusCache
+
+    monkeypatch.setattr("vault_ui.factory._status_cache", StatusCache())
+
+    response = test_client.post("/api/cache/reload")
+
+    assert response.status_code == 200
+    assert response.json() == {"reloaded": ["TestVault"], "counts": {"TestVault": 1}}
+
+
+def test_reload_cache_unknown_vault_returns_404(test_client: TestClient) -> None:
+    """Unknown vault names are rejected with 404."""
+    response = test_client.post("/api/cache/reload?vault=Nope")
+
+    assert response.status_code == 404
+
+
 def test_parse_defer_date_date_only() -> None:
     """Date-only string returns timezone-aware datetime at midnight UTC."""
 
@@ -1128,6 +1310,18 @@ def test_parse_defer_date_rfc3339() -> None:
     assert result.day == 19
 
 
+def test_parse_defer_date_is_memoized() -> None:
+    """Repeated defer_date strings are parsed once and share the cached result."""
+    from vault_ui.api.tasks import _parse_defer_date
+
+    _parse_defer_date.cache_clear()
+    first = _parse_defer_date("2026-04-01")
+    second = _parse_defer_date("2026-04-01")
+
+    assert first is second
+    assert _parse_defer_date.cache_info().hits == 1
+
+
 # --- upcoming filtering tests ---
 
 
@@ -2206,6 +2400,50 @@ def test_list_assignees_no_vault_returns_all_vaults(
     assert "bob" in data["named"]
 
 
+def test_list_assignees_vault_reads_overlap(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Per-vault list_tasks calls for /api/assignees run concurrently."""
+    test_config = Config(
+        vaults=[
+            VaultConfig(name="V1", vault_path=str(tmp_path / "v1"), tasks_folder="Tasks"),
+            VaultConfig(name="V2", vault_path=str(tmp_path / "v2"), tasks_folder="Tasks"),
+        ],
+        host="127.0.0.1",
+        port=8000,
+    )
+    monkeypatch.setattr("vault_ui.factory._config", test_config)
+
+    call_times: dict[str, tuple[float, float]] = {}
+
+    def make_client(name: str, assignee: str) -> MagicMock:
+        client = MagicMock()
+
+        async def list_tasks(**kwargs: Any) -> list[Task]:
+            start = time.monotonic()
+            await asyncio.sleep(0.05)
+            call_times[name] = (start, time.monotonic())
+            return [_make_task(task_id=f"{name} Task", assignee=assignee)]
+
+        client.list_tasks = list_tasks
+        return client
+
+    clients = {"V1": make_client("V1", "alice"), "V2": make_client("V2", "bob")}
+    http_client = TestClient(create_app())
+
+    with patch(
+        "vault_ui.api.tasks.get_vault_cli_client_for_vault",
+        side_effect=lambda vn: clients[vn],
+    ):
+        response = http_client.get("/api/assignees")
+
+    assert response.status_code == 200
+    assert response.json()["named"] == ["alice", "bob"]
+    # Both calls started before either finished
+    assert call_times["V1"][0] < call_times["V2"][1]
+    assert call_times["V2"][0] < call_times["V1"][1]
+
+
 def test_list_assignees_invalid_vault_silently_skipped(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -3249,3 +3487,61 @@ def test_list_tasks_response_unchanged(test_client: TestClient) -> None:
     assert expected_keys.issubset(set(task.keys())), (
         f"missing pre-existing keys: {expected_keys - set(task.keys())}"
     )
+
+
+@pytest.mark.parametrize(
+    "frontmatter",
+    [
+        {"phase": ["x"]},
+        {"assignee": 12},
+        {"category": {"nested": True}},
+    ],
+)
+def test_task_to_response_rejects_mistyped_frontmatter(frontmatter: dict[str, Any]) -> None:
+    """Mistyped vault-cli frontmatter fails TaskResponse validation instead of leaking out."""
+    from pydantic import ValidationError
+
+    from vault_ui.api.tasks import _task_to_response
+    from vault_ui.vault_cli_client import VaultCLIClient
+
+    task = VaultCLIClient("vault-cli", "TestVault")._parse_task(
+        {"id": "Bad Task", "title": "Bad Task", "status": "todo", **frontmatter}
+    )
+
+    with pytest.raises(ValidationError):
+        _task_to_response(task, _make_vault_config())
+
+
+def test_list_tasks_serializes_without_jsonable_encoder(test_client: TestClient) -> None:
+    """/api/tasks is dumped to JSON bytes by the response model, not jsonable_encoder."""
+    with patch(
+        "fastapi.routing.jsonable_encoder",
+        side_effect=AssertionError("jsonable_encoder used for /api/tasks"),
+    ):
+        response = test_client.get("/api/tasks?vault=TestVault")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()[0]["id"] == "Test Task"
+
+
+@pytest.mark.parametrize(
+    "vault_name,folder,item_id",
+    [
+        ("Personal", "24 Tasks", "Write report"),
+        ("My Vault", "37 Tasks", "Ünïcode & symbols?#"),
+        ("Work", "Tasks", "nested/like id"),
+    ],
+)
+def test_obsidian_url_prefix_matches_full_path_quote(
+    vault_name: str, folder: str, item_id: str
+) -> None:
+    """Prefix + quoted id equals quoting the whole file path in one go."""
+    from urllib.parse import quote
+
+    vault_config = VaultConfig(
+        name=vault_name, vault_path="/vault", tasks_folder=folder, vault_name=vault_name
+    )
+    expected = f"obsidian://open?vault={quote(vault_name)}&file={quote(f'{folder}/{item_id}.md')}"
+
+    assert f"{vault_config.obsidian_url_prefix}{quote(item_id)}.md" == expected
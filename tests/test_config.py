@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from vault_ui.config import load_config
+from vault_ui.config import Config, VaultConfig, load_config
 
 
 def _mock_run(vaults: list[dict] | None = None) -> MagicMock:
@@ -174,3 +174,35 @@ def test_get_vault_returns_correct_vault(tmp_path: Path) -> None:
     assert config.get_vault("personal").vault_path == "/personal"
     assert config.get_vault("work") is not None
     assert config.get_vault("missing") is None
+
+
+def test_load_config_precomputes_obsidian_url_prefix(tmp_path: Path) -> None:
+    """VaultConfig encodes the obsidian:// prefix for its tasks folder once at load."""
+    cli_vaults = [{"name": "my vault", "path": "/some/path", "tasks_dir": "24 Tasks"}]
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("vaults:\n  my vault:\n")
+    with patch("subprocess.run", side_effect=_make_side_effect(cli_vaults)):
+        config = load_config(config_file)
+    assert (
+        config.vaults[0].obsidian_url_prefix == "obsidian://open?vault=My%20Vault&file=24%20Tasks/"
+    )
+
+
+def test_get_vault_first_match_wins_on_duplicate_names() -> None:
+    """The name index keeps the first vault for a repeated name, like the old scan."""
+    first = VaultConfig(name="dup", vault_path="/first", tasks_folder="Tasks")
+    second = VaultConfig(name="dup", vault_path="/second", tasks_folder="Tasks")
+    config = Config(vaults=[first, second])
+    assert config.get_vault("dup") is first
+    assert config.get_vault("other") is None
+
+
+def test_vault_config_is_frozen_and_slotted() -> None:
+    """VaultConfig has no per-instance __dict__ and rejects mutation."""
+    import dataclasses
+
+    vault = VaultConfig(name="work", vault_path="/work", tasks_folder="Tasks", vault_name="Work")
+    assert not hasattr(vault, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        vault.tasks_folder = "Other"  # type: ignore[misc]
+    assert vault.obsidian_url_prefix == "obsidian://open?vault=Work&file=Tasks/"
@@ -0,0 +1,98 @@
+"""Tests for ConnectionManager broadcast."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from vault_ui.websocket import ConnectionManager, connection_manager
+
+
+def _make_websocket(send_text: AsyncMock | None = None) -> MagicMock:
+    websocket = MagicMock()
+    websocket.send_text = send_text or AsyncMock()
+    return websocket
+
+
+async def test_broadcast_sends_same_payload_to_all_clients() -> None:
+    """Every client receives the message serialized once as a JSON text frame."""
+    manager = ConnectionManager()
+    clients = [_make_websocket() for _ in range(3)]
+    manager.active_connections.update(clients)
+
+    await manager.broadcast({"type": "task_updated", "task_id": "Task Ä"})
+
+    payloads = [client.send_text.await_args.args[0] for client in clients]
+    assert len(set(payloads)) == 1
+    assert json.loads(payloads[0]) == {"type": "task_updated", "task_id": "Task Ä"}
+
+
+async def test_broadcast_sends_concurrently() -> None:
+    """A slow client does not hold back delivery to the others."""
+    release = asyncio.Event()
+    fast_sent = asyncio.Event()
+
+    async def slow_send(_: str) -> None:
+        await release.wait()
+
+    async def fast_send(_: str) -> None:
+        fast_sent.set()
+
+    manager = ConnectionManager()
+    manager.active_connections.update(
+        [
+            _make_websocket(AsyncMock(side_effect=slow_send)),
+            _make_websocket(AsyncMock(side_effect=fast_send)),
+        ]
+    )
+
+    broadcast = asyncio.create_task(manager.broadcast({"type": "task_updated"}))
+    await asyncio.wait_for(fast_sent.wait(), timeout=1)
+    release.set()
+    await broadcast
+
+
+async def test_broadcast_drops_failed_connections() -> None:
+    """Clients whose send raises are disconnected; healthy ones stay registered."""
+    manager = ConnectionManager()
+    healthy = _make_websocket()
+    dead = _make_websocket(AsyncMock(side_effect=RuntimeError("closed")))
+    manager.active_connections.update([healthy, dead])
+
+    await manager.broadcast({"type": "task_updated"})
+
+    assert manager.active_connections == {healthy}
+    healthy.send_text.assert_awaited_once()
+
+
+async def test_broadcast_drops_and_closes_stalled_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A client whose send exceeds the timeout is closed and dropped."""
+    monkeypatch.setattr(connection_manager, "_SEND_TIMEOUT_SECONDS", 0.01)
+
+    async def stall(_: str) -> None:
+        await asyncio.sleep(1)
+
+    manager = ConnectionManager()
+    healthy = _make_websocket()
+    stalled = _make_websocket(AsyncMock(side_effect=stall))
+    stalled.close = AsyncMock()
+    manager.active_connections.update([healthy, stalled])
+
+    await manager.broadcast({"type": "task_updated"})
+
+    assert manager.active_connections == {healthy}
+    stalled.close.assert_awaited_once_with(code=1013)
+
+
+async def test_disconnect_is_idempotent() -> None:
+    """Disconnecting an unknown or already removed client is a no-op."""
+    manager = ConnectionManager()
+    client = _make_websocket()
+    client.accept = AsyncMock()
+
+    await manager.connect(client)
+    manager.disconnect(client)
+    manager.disconnect(client)
+
+    assert manager.active_connections == set()
@@ -0,0 +1,135 @@
+"""Tests for the dependency injection factory."""
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from vault_ui import factory
+from vault_ui.config import Config, VaultConfig
+from vault_ui.factory import get_vault_cli_client_for_vault
+
+
+def _config(vault_cli_path: str = "vault-cli") -> Config:
+    return Config(
+        vaults=[
+            VaultConfig(
+                name="TestVault",
+                vault_path="/vault",
+                tasks_folder="24 Tasks",
+                vault_cli_path=vault_cli_path,
+            )
+        ]
+    )
+
+
+def test_vault_cli_client_reused_across_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeated lookups for the same vault return the same client instance."""
+    monkeypatch.setattr("vault_ui.factory._config", _config())
+
+    first = get_vault_cli_client_for_vault("TestVault")
+    second = get_vault_cli_client_for_vault("TestVault")
+
+    assert first is second
+
+
+def test_vault_cli_client_follows_config_swap(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A config with a different vault-cli path yields a client for that path."""
+    monkeypatch.setattr("vault_ui.factory._config", _config("vault-cli"))
+    before = get_vault_cli_client_for_vault("TestVault")
+
+    monkeypatch.setattr("vault_ui.factory._config", _config("/opt/bin/vault-cli"))
+    after = get_vault_cli_client_for_vault("TestVault")
+
+    assert after is not before
+    assert after._vault_cli_path == "/opt/bin/vault-cli"
+
+
+def test_vault_cli_client_unknown_vault_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Unknown vault names raise ValueError (callers map this to skip/404)."""
+    monkeypatch.setattr("vault_ui.factory._config", _config())
+
+    with pytest.raises(ValueError, match="Unknown vault"):
+        get_vault_cli_client_for_vault("Nope")
+
+
+def test_create_app_mounts_static_dir_resolved_at_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    """create_app mounts the import-time static dir and skips it when absent."""
+    assert factory._STATIC_DIR is not None
+    assert "static" in {getattr(r, "name", None) for r in factory.create_app().routes}
+
+    monkeypatch.setattr(factory, "_STATIC_DIR", None)
+    assert "static" not in {getattr(r, "name", None) for r in factory.create_app().routes}
+
+
+async def test_spawn_holds_task_until_done() -> None:
+    """_spawn keeps a strong reference to a pending task and drops it on completion."""
+    release = asyncio.Event()
+
+    async def work() -> None:
+        await release.wait()
+
+    factory._spawn(asyncio.get_running_loop(), work())
+    assert len(factory._background_tasks) == 1
+
+    release.set()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert not factory._background_tasks
+
+
+async def test_spawn_starts_task_eagerly_without_changing_task_factory() -> None:
+    """A spawned task runs to completion inside _spawn; other tasks stay lazy."""
+    loop = asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+    ran: list[str] = []
+
+    async def work(name: str) -> None:
+        ran.append(name)
+
+    factory._spawn(loop, work("spawned"))
+    assert ran == ["spawned"]
+    assert not factory._background_tasks
+
+    task = asyncio.create_task(work("plain"))
+    assert ran == ["spawned"]
+    await task
+    assert loop.get_task_factory() is previous
+
+
+async def test_lifespan_loads_status_cache_and_keeps_task_factory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Startup warms the status cache and leaves the loop's task factory untouched."""
+    monkeypatch.setattr(factory, "_config", _config())
+    cache = MagicMock()
+    monkeypatch.setattr(factory, "get_status_cache", lambda: cache)
+    monkeypatch.setattr(factory, "start_task_watchers", lambda *_: None)
+    monkeypatch.setattr(factory, "stop_task_watchers", lambda: None)
+    monkeypatch.setattr(factory, "run_cleanup_loop", AsyncMock())
+
+    loop = asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+    async with factory.lifespan(factory.create_app()):
+        assert loop.get_task_factory() is previous
+    assert loop.get_task_factory() is previous
+    cache.load_vault.assert_called_once_with("TestVault", Path("/vault"), "24 Tasks")
+
+
+async def test_invalidate_runs_off_loop_before_broadcast() -> None:
+    """The status re-read runs in the worker thread and finishes before the broadcast."""
+    calls: list[str] = []
+    cache = MagicMock()
+    cache.invalidate.side_effect = lambda *_: calls.append(threading.current_thread().name)
+    manager = MagicMock()
+    manager.broadcast = AsyncMock(side_effect=lambda _: calls.append("broadcast"))
+    message = {"type": "task_updated", "task_id": "My Task", "vault": "TestVault"}
+
+    await factory._invalidate_then_broadcast(cache, manager, "TestVault", "My Task", message)
+
+    cache.invalidate.assert_called_once_with("TestVault", "My Task")
+    manager.broadcast.assert_awaited_once_with(message)
+    assert calls[0].startswith("status-invalidate")
+    assert calls[1] == "broadcast"
@@ -1,10 +1,13 @@
 """Tests for src/vault_ui/__main__.py."""
 
 import logging
+import logging.handlers
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from vault_ui.__main__ import _parse_log_level
+from vault_ui.__main__ import _install_queue_logging, _parse_log_level, main
+from vault_ui.config import Config
 
 
 def test_log_level_default_info() -> None:
@@ -60,3 +63,67 @@ def test_log_level_invalid_value_warns_and_falls_back(raw: str) -> None:
     assert warning is not None
     assert raw in warning
     assert "INFO" in warning
+
+
+def test_main_leaves_loop_and_http_on_auto(monkeypatch: pytest.MonkeyPatch) -> None:
+    """main() lets uvicorn pick uvloop/httptools when installed instead of forcing them."""
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+    config = Config(host="127.0.0.1", port=8123)
+    with (
+        patch("vault_ui.__main__.get_config", return_value=config),
+        patch("vault_ui.__main__._install_queue_logging", MagicMock()) as mock_install,
+        patch("vault_ui.__main__.uvicorn.run", MagicMock()) as mock_run,
+    ):
+        assert main() == 0
+
+    mock_install.return_value.stop.assert_called_once()
+    kwargs = mock_run.call_args.kwargs
+    assert kwargs["host"] == "127.0.0.1"
+    assert kwargs["port"] == 8123
+    assert kwargs["log_level"] == "info"
+    assert kwargs.get("loop", "auto") == "auto"
+    assert kwargs.get("http", "auto") == "auto"
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def test_install_queue_logging_routes_records_through_listener() -> None:
+    """Existing handlers move behind the queue; records arrive once the listener drains."""
+    logger = logging.getLogger("vault_ui.test_queue_logging")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    sink = _ListHandler()
+    logger.handlers = [sink]
+
+    listener = _install_queue_logging(logger)
+    try:
+        assert sink not in logger.handlers
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+        logger.info("hello %s", "queue")
+    finally:
+        listener.stop()
+
+    assert sink.messages == ["hello queue"]
+
+
+def test_install_queue_logging_drops_records_when_queue_full() -> None:
+    """A full queue drops records instead of raising or blocking the caller."""
+    logger = logging.getLogger("vault_ui.test_queue_logging_full")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    sink = _ListHandler()
+    logger.handlers = [sink]
+
+    listener = _install_queue_logging(logger, maxsize=1)
+    listener.stop()  # no drain thread: the queue fills after one record
+    for i in range(5):
+        logger.info("record %d", i)
+
+    assert sink.messages == []
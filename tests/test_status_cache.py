@@ -0,0 +1,302 @@
+"""Tests for StatusCache."""
+
+import os
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+
+from vault_ui.status_cache import StatusCache, _FileMeta
+
+
+def _write_item(folder: Path, item_id: str, status: str | None) -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / f"{item_id}.md"
+    frontmatter = f"status: {status}\n" if status is not None else "phase: todo\n"
+    path.write_text(f"---\n{frontmatter}---\n# {item_id}\n")
+    return path
+
+
+def test_load_vault_caches_statuses(tmp_vault: Path) -> None:
+    """Items with a status field are cached; items without one are skipped."""
+    _write_item(tmp_vault / "24 Tasks", "Done Task", "completed")
+    _write_item(tmp_vault / "24 Tasks", "Open Task", "in_progress")
+    _write_item(tmp_vault / "24 Tasks", "No Status", None)
+    _write_item(tmp_vault / "23 Goals", "Some Goal", "next")
+
+    cache = StatusCache()
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+
+    assert cache.get_status("Test", "Done Task") == "completed"
+    assert cache.get_status("Test", "Open Task") == "in_progress"
+    assert cache.get_status("Test", "Some Goal") == "next"
+    assert cache.get_status("Test", "No Status") is None
+    assert cache.count("Test") == 3
+
+
+def test_get_vault_statuses_matches_get_status(tmp_vault: Path) -> None:
+    """The bulk mapping agrees with per-item get_status lookups."""
+    _write_item(tmp_vault / "24 Tasks", "Done Task", "completed")
+    _write_item(tmp_vault / "24 Tasks", "Open Task", "todo")
+
+    cache = StatusCache()
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+
+    statuses = cache.get_vault_statuses("Test")
+    assert dict(statuses) == {"Done Task": "completed", "Open Task": "todo"}
+    assert cache.get_vault_statuses("Unknown") == {}
+
+
+def test_get_vault_statuses_is_a_stable_read_only_snapshot(tmp_vault: Path) -> None:
+    """Later invalidations do not change a snapshot a caller already holds."""
+    _write_item(tmp_vault / "24 Tasks", "Task", "todo")
+    cache = StatusCache()
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+
+    snapshot = cache.get_vault_statuses("Test")
+    with pytest.raises(TypeError):
+        snapshot["Task"] = "completed"  # type: ignore[index]
+
+    _write_item(tmp_vault / "24 Tasks", "Task", "completed")
+    _write_item(tmp_vault / "24 Tasks", "New", "next")
+    cache.invalidate("Test", "Task")
+    cache.invalidate("Test", "New")
+
+    assert dict(snapshot) == {"Task": "todo"}
+    assert dict(cache.get_vault_statuses("Test")) == {"Task": "completed", "New": "next"}
+
+
+def test_invalidate_updates_and_removes(tmp_vault: Path) -> None:
+    """invalidate() re-reads one item and drops it when the file is gone."""
+    task_file = _write_item(tmp_vault / "24 Tasks", "Task", "todo")
+    cache = StatusCache()
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+
+    _write_item(tmp_vault / "24 Tasks", "Task", "completed")
+    cache.invalidate("Test", "Task")
+    assert cache.get_status("Test", "Task") == "completed"
+
+    task_file.unlink()
+    cache.invalidate("Test", "Task")
+    assert cache.get_status("Test", "Task") is None
+
+
+def test_extract_status_uses_libyaml_loader_when_available(tmp_vault: Path) -> None:
+    """Frontmatter is parsed with CSafeLoader when PyYAML ships libyaml bindings."""
+    import yaml
+
+    from vault_ui import status_cache
+
+    expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+    assert status_cache._YAML_LOADER is expected
+
+    path = _write_item(tmp_vault / "24 Tasks", "Task", "in_progress")
+    assert StatusCache()._extract_status(path) == "in_progress"
+
+
+def test_extract_status_reads_frontmatter_only(tmp_vault: Path) -> None:
+    """Only the frontmatter block is parsed; body rules and unterminated blocks are handled."""
+    folder = tmp_vault / "24 Tasks"
+    cache = StatusCache()
+
+    with_body = folder / "Body.md"
+    with_body.write_text("---\nstatus: todo\n---\n# Body\n\n---\nstatus: completed\n")
+    assert cache._extract_status(with_body) == "todo"
+
+    unterminated = folder / "Open.md"
+    unterminated.write_text("---\nstatus: todo\n# no closing delimiter\n")
+    assert cache._extract_status(unterminated) is None
+
+    no_frontmatter = folder / "Plain.md"
+    no_frontmatter.write_text("# Plain\nstatus: todo\n")
+    assert cache._extract_status(no_frontmatter) is None
+
+
+def test_load_vault_many_files(tmp_vault: Path) -> None:
+    """Pooled extraction maps every file's status back to its own item ID."""
+    for i in range(60):
+        _write_item(tmp_vault / "24 Tasks", f"Task {i}", "completed" if i % 2 else "todo")
+
+    cache = StatusCache()
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+
+    assert cache.count("Test") == 60
+    assert all(
+        cache.get_status("Test", f"Task {i}") == ("completed" if i % 2 else "todo")
+        for i in range(60)
+    )
+
+
+def test_extract_status_gives_up_on_oversized_frontmatter(tmp_vault: Path) -> None:
+    """A frontmatter block past the size cap is not parsed, even if terminated."""
+    from vault_ui import status_cache
+
+    path = tmp_vault / "24 Tasks" / "Huge.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    padding = "x" * (status_cache._MAX_FRONTMATTER_BYTES + 1)
+    path.write_text(f"---\nstatus: todo\nnote: {padding}\n---\n")
+    assert StatusCache()._extract_status(path) is None
+
+    path.write_text(f"---\nstatus: todo\n---\n{padding}\n")
+    assert StatusCache()._extract_status(path) == "todo"
+
+
+@pytest.mark.parametrize(
+    "frontmatter",
+    [
+        "status: completed\n",
+        "title: x\nstatus: in_progress  # comment\n",
+        "status: 'todo'\n",
+        'status: "next"\n',
+        "status: yes\n",
+        "status: 'yes'\n",
+        "status: 42\n",
+        "status:\n",
+        "status: null\n",
+        "status: in\n  progress\n",
+        "status: todo\nstatus: completed\n",
+        "status: two words\n",
+        "status:todo\n",
+        "meta:\n  status: nested\n",
+    ],
+)
+def test_extract_status_fast_scan_matches_yaml(tmp_vault: Path, frontmatter: str) -> None:
+    """The line scanner and its YAML fallback agree with a full YAML parse."""
+    import yaml
+
+    path = tmp_vault / "24 Tasks" / "Item.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\n{frontmatter}---\n# Body\n")
+
+    parsed = yaml.safe_load(frontmatter)
+    expected = parsed.get("status") if isinstance(parsed, dict) else None
+    assert StatusCache()._extract_status(path) == expected
+
+
+def test_load_vault_reparses_only_changed_files(tmp_vault: Path) -> None:
+    """A reload reuses statuses of files whose mtime and size are unchanged."""
+    _write_item(tmp_vault / "24 Tasks", "Same", "todo")
+    _write_item(tmp_vault / "24 Tasks", "Edited", "todo")
+    removed = _write_item(tmp_vault / "24 Tasks", "Gone", "todo")
+
+    cache = StatusCache()
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+
+    _write_item(tmp_vault / "24 Tasks", "Edited", "completed")  # size changes
+    removed.unlink()
+
+    parsed: list[str] = []
+    original = cache._extract_status
+
+    def spy(path: Path) -> str | None:
+        parsed.append(path.stem)
+        return original(path)
+
+    cache._extract_status = spy  # type: ignore[method-assign]
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+
+    assert parsed == ["Edited"]
+    assert cache.get_status("Test", "Same") == "todo"
+    assert cache.get_status("Test", "Edited") == "completed"
+    assert cache.get_status("Test", "Gone") is None
+
+
+def test_iter_md_files_walks_in_sorted_pre_order(tmp_path: Path) -> None:
+    """Files come before subdirectories, siblings by name, each subtree in full."""
+    from vault_ui.status_cache import _iter_md_files
+
+    root = tmp_path / "24 Tasks"
+    for rel in ("b/y", "a/x", "dir.md"):
+        (root / rel).mkdir(parents=True)
+    (tmp_path / "outside").mkdir()
+    (tmp_path / "outside" / "Linked.md").write_text("---\nstatus: todo\n---\n")
+    (root / "linked-dir").symlink_to(tmp_path / "outside")
+    for rel in ("5.md", "notes.txt", "b/4.md", "b/y/3.md", "a/x/1.md", "a/2.md"):
+        (root / rel).write_text("---\nstatus: todo\n---\n")
+
+    paths = [Path(entry.path).relative_to(root).as_posix() for entry in _iter_md_files(str(root))]
+    assert paths == ["5.md", "a/2.md", "a/x/1.md", "b/4.md", "b/y/3.md"]
+
+
+def test_load_vault_duplicate_item_id_last_in_walk_wins(tmp_vault: Path) -> None:
+    """With the same item ID in sibling nested folders, the later sibling's file wins."""
+    _write_item(tmp_vault / "24 Tasks" / "b" / "y", "Dup", "completed")
+    _write_item(tmp_vault / "24 Tasks" / "a" / "x", "Dup", "todo")
+    _write_item(tmp_vault / "24 Tasks" / "a", "Other", "todo")
+
+    cache = StatusCache()
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+
+    assert cache.get_status("Test", "Dup") == "completed"
+
+
+def test_invalidate_uses_known_path_without_folder_scan(
+    tmp_vault: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A loaded item is re-read from its known path; new items still fall back to a scan."""
+    from vault_ui import status_cache
+
+    _write_item(tmp_vault / "24 Tasks" / "nested", "Deep", "todo")
+    cache = StatusCache()
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+
+    scans: list[Path] = []
+    original = status_cache.discover_hierarchy_folders_for_vault
+
+    def counting(vault_path: Path, tasks_folder: str) -> list[Path]:
+        scans.append(vault_path)
+        return original(vault_path, tasks_folder)
+
+    monkeypatch.setattr(status_cache, "discover_hierarchy_folders_for_vault", counting)
+
+    _write_item(tmp_vault / "24 Tasks" / "nested", "Deep", "completed")
+    cache.invalidate("Test", "Deep")
+    assert cache.get_status("Test", "Deep") == "completed"
+    assert scans == []
+
+    _write_item(tmp_vault / "24 Tasks", "Fresh", "next")
+    cache.invalidate("Test", "Fresh")
+    assert cache.get_status("Test", "Fresh") == "next"
+    assert len(scans) == 1
+
+
+def test_unknown_vault_lookups_share_read_only_empty_mapping() -> None:
+    """Misses on an unloaded vault reuse one immutable empty mapping."""
+    cache = StatusCache()
+
+    statuses = cache.get_vault_statuses("Unknown")
+    assert statuses is cache.get_vault_statuses("Other")
+    assert cache.get_status("Unknown", "Task") is None
+    assert cache.count("Unknown") == 0
+    with pytest.raises(TypeError):
+        statuses["Task"] = "todo"  # type: ignore[index]
+
+
+def test_invalidate_during_load_vault_is_not_lost(
+    tmp_vault: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An invalidation landing mid-reload survives the reload's snapshot swap."""
+    path = _write_item(tmp_vault / "24 Tasks", "Blocker", "in_progress")
+    cache = StatusCache()
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+
+    # Make the next reload see a changed file, so the walk itself reads it
+    path.write_text("---\nstatus: todo\n---\n# Blocker\n")
+    original = StatusCache._load_file
+
+    def load_then_edit(
+        self: StatusCache, entry: os.DirEntry[str], known: Mapping[str, _FileMeta]
+    ) -> _FileMeta | None:
+        meta = original(self, entry, known)
+        # The watcher fires after the walk read the file, before the swap
+        _write_item(tmp_vault / "24 Tasks", "Blocker", "completed")
+        self.invalidate("Test", "Blocker")
+        return meta
+
+    monkeypatch.setattr(StatusCache, "_load_file", load_then_edit)
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+    assert cache.get_status("Test", "Blocker") == "completed"
+
+    monkeypatch.setattr(StatusCache, "_load_file", original)
+    cache.load_vault("Test", tmp_vault, "24 Tasks")
+    assert cache.get_status("Test", "Blocker") == "completed"
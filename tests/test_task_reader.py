@@ -218,58 +218,43 @@ async def test_parse_task_with_dates_and_metadata() -> None:
     assert task.recurring is None
 
 
-@pytest.mark.asyncio
-async def test_parse_task_without_project() -> None:
+def test_parse_task_without_project() -> None:
     """Test _parse_task handles missing project field."""
     client = VaultCLIClient("vault-cli", "TestVault")
-    task_data = json.dumps({"id": "No Project", "title": "No Project", "status": "in_progress"})
-    proc = _make_proc(0, task_data.encode())
 
-    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        task = await client.show_task("No Project")
+    task = client._parse_task({"id": "No Project", "title": "No Project", "status": "in_progress"})
 
     assert task.id == "No Project"
     assert task.status == "in_progress"
     assert task.project_path is None
 
 
-@pytest.mark.asyncio
-async def test_parse_task_bool_priority_returns_none() -> None:
-    """Test that boolean priority values are rejected."""
+@pytest.mark.parametrize(
+    ("raw_priority", "expected"),
+    [
+        (True, None),
+        (1.5, None),
+        ("  ", None),
+        ("2", 2),
+        ("high", "high"),
+    ],
+)
+def test_parse_task_priority(raw_priority: object, expected: int | str | None) -> None:
+    """Test that bool/float/blank priorities are rejected and numeric strings become int."""
     client = VaultCLIClient("vault-cli", "TestVault")
-    task_data = json.dumps({"id": "t", "title": "t", "status": "todo", "priority": True})
-    proc = _make_proc(0, task_data.encode())
-
-    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        task = await client.show_task("t")
 
-    assert task.priority is None
+    task = client._parse_task({"id": "t", "title": "t", "status": "todo", "priority": raw_priority})
 
+    assert task.priority == expected
 
-@pytest.mark.asyncio
-async def test_parse_task_string_numeric_priority_converted() -> None:
-    """Test that numeric string priority is converted to int."""
-    client = VaultCLIClient("vault-cli", "TestVault")
-    task_data = json.dumps({"id": "t", "title": "t", "status": "todo", "priority": "2"})
-    proc = _make_proc(0, task_data.encode())
 
-    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        task = await client.show_task("t")
-
-    assert task.priority == 2
-
-
-@pytest.mark.asyncio
-async def test_parse_task_blocked_by_list() -> None:
+def test_parse_task_blocked_by_list() -> None:
     """Test that blocked_by list is parsed correctly."""
     client = VaultCLIClient("vault-cli", "TestVault")
-    task_data = json.dumps(
+
+    task = client._parse_task(
         {"id": "t", "title": "t", "status": "todo", "blocked_by": ["[[Task A]]", "[[Task B]]"]}
     )
-    proc = _make_proc(0, task_data.encode())
-
-    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        task = await client.show_task("t")
 
     assert task.blocked_by == ["[[Task A]]", "[[Task B]]"]
 
@@ -3,82 +3,97 @@ the kind-scoped cache invalidation respects the no-cross-rerender invariant
 (spec AC#9)."""
 
 import asyncio
+import threading
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from vault_ui import factory
+from vault_ui.config import Config, VaultConfig
 
-def _run_callback(callback: Any, *args: Any) -> None:
-    """Helper: invoke the watcher callback synchronously.
+WatcherCallback = Callable[[str, str, str, str], None]
 
-    The factory's callback is sync (it schedules the broadcast via
-    ``asyncio.run_coroutine_threadsafe``), so we can call it directly.
-    """
-    callback(*args)
-
-
-def _build_callback(
-    connection_manager: MagicMock,
-    cache: MagicMock,
-    vault_task_cache: dict[str, tuple[float, list[Any]]],
-    vault_goal_cache: dict[str, tuple[float, list[Any]]],
-    loop: asyncio.AbstractEventLoop,
-) -> Any:
-    """Replicate the closure body from ``start_task_watchers``.
-
-    The factory callback is built per-vault with closures over ``cache``,
-    the two cache dicts, and the event loop. Tests below build their own
-    version so they can assert the exact behavior (kind-scoped cache
-    invalidation + item_kind in the broadcast payload) without spinning
-    up the full FastAPI lifespan.
+
+@pytest.fixture
+def build_callback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[Callable[..., WatcherCallback]]:
+    """Build the real per-vault callback from ``start_task_watchers``.
+
+    The vault-cli watcher is replaced by a stub that captures ``on_change``,
+    and session resolution is stubbed out, so the tests exercise the shipped
+    closure (status invalidation in the worker thread, kind-scoped cache
+    invalidation, broadcast payload) without spawning subprocesses.
     """
 
-    def callback(
-        event_type: str,
-        item_id: str,
-        vault_arg: str,
-        item_kind: str,
-    ) -> None:
-        cache.invalidate(vault_arg, item_id)
-        # Kind-scoped invalidation: only the cache matching the event's
-        # kind is touched (spec AC#9).
-        if item_kind == "task":
-            vault_task_cache.pop(vault_arg, None)
-        elif item_kind == "goal":
-            vault_goal_cache.pop(vault_arg, None)
-        # theme / objective / empty kind: no cache to invalidate
-        message = {
-            "type": event_type,
-            "task_id": item_id,
-            "vault": vault_arg,
-            "item_kind": item_kind,
-        }
-        asyncio.run_coroutine_threadsafe(connection_manager.broadcast(message), loop)
-
-    return callback
+    def build(
+        connection_manager: MagicMock,
+        cache: MagicMock,
+        vault_task_cache: dict[str, tuple[float, list[Any]]],
+        vault_goal_cache: dict[str, tuple[float, list[Any]]],
+    ) -> WatcherCallback:
+        callbacks: list[WatcherCallback] = []
+
+        class _StubWatcher:
+            def __init__(
+                self, vault_cli_path: str, vault_name: str, on_change: WatcherCallback
+            ) -> None:
+                callbacks.append(on_change)
+
+            async def start(self) -> None:
+                return None
+
+            def terminate(self) -> None:
+                return None
+
+        config = Config(
+            vaults=[VaultConfig(name="TestVault", vault_path="/vault", tasks_folder="24 Tasks")]
+        )
+        monkeypatch.setattr(factory, "VaultCLIWatcher", _StubWatcher)
+        monkeypatch.setattr(factory, "get_config", lambda: config)
+        monkeypatch.setattr(factory, "get_connection_manager", lambda: connection_manager)
+        monkeypatch.setattr(factory, "get_status_cache", lambda: cache)
+        monkeypatch.setattr(factory, "_try_resolve_task_session", AsyncMock())
+        monkeypatch.setattr(factory, "_try_resolve_goal_session", AsyncMock())
+
+        factory.start_task_watchers(vault_task_cache, vault_goal_cache)
+        assert len(callbacks) == 1
+        return callbacks[0]
+
+    yield build
+    factory.stop_task_watchers()
+
+
+async def _drain() -> None:
+    """Wait for the tasks the callback spawned (invalidation runs in a worker thread)."""
+    while factory._background_tasks:
+        await asyncio.gather(*factory._background_tasks)
 
 
 @pytest.mark.asyncio
-async def test_watcher_callback_broadcasts_item_kind_task() -> None:
+async def test_watcher_callback_broadcasts_item_kind_task(
+    build_callback: Callable[..., WatcherCallback],
+) -> None:
     """A 'task' event from the watcher produces a broadcast with
     ``item_kind: "task"`` (spec AC#4 + prompt 3)."""
+    events: list[str] = []
     connection_manager = MagicMock()
-    connection_manager.broadcast = AsyncMock()
+    connection_manager.broadcast = AsyncMock(side_effect=lambda _: events.append("broadcast"))
     cache = MagicMock()
-    cache.invalidate = MagicMock()
+    cache.invalidate = MagicMock(
+        side_effect=lambda *_: events.append(threading.current_thread().name)
+    )
 
     vault_task_cache: dict[str, tuple[float, list[Any]]] = {}
     vault_goal_cache: dict[str, tuple[float, list[Any]]] = {}
 
-    loop = asyncio.get_running_loop()
-    cb = _build_callback(connection_manager, cache, vault_task_cache, vault_goal_cache, loop)
-    _run_callback(cb, "modified", "My Task", "TestVault", "task")
+    cb = build_callback(connection_manager, cache, vault_task_cache, vault_goal_cache)
+    cb("modified", "My Task", "TestVault", "task")
 
-    # Drain the scheduled broadcast (run_coroutine_threadsafe schedules on the loop)
-    await asyncio.sleep(0)
-    await asyncio.sleep(0)
+    await _drain()
 
     assert connection_manager.broadcast.await_count >= 1
     last_message = connection_manager.broadcast.call_args_list[-1].args[0]
@@ -88,12 +103,17 @@ async def test_watcher_callback_broadcasts_item_kind_task() -> None:
     assert last_message["vault"] == "TestVault"
     # Status cache invalidation is unconditional
     cache.invalidate.assert_called_once_with("TestVault", "My Task")
+    # ...and runs off the event loop, before the broadcast goes out
+    assert events[0].startswith("status-invalidate")
+    assert events[1] == "broadcast"
     # Cache invalidation: task event touches ONLY the task cache
     assert "TestVault" not in vault_goal_cache  # goal cache untouched
 
 
 @pytest.mark.asyncio
-async def test_watcher_callback_broadcasts_item_kind_goal() -> None:
+async def test_watcher_callback_broadcasts_item_kind_goal(
+    build_callback: Callable[..., WatcherCallback],
+) -> None:
     """A 'goal' event produces ``item_kind: "goal"`` and invalidates ONLY
     the goal cache (spec AC#4 + AC#9)."""
     connection_manager = MagicMock()
@@ -104,11 +124,9 @@ async def test_watcher_callback_broadcasts_item_kind_goal() -> None:
     vault_task_cache: dict[str, tuple[float, list[Any]]] = {}
     vault_goal_cache: dict[str, tuple[float, list[Any]]] = {}
 
-    loop = asyncio.get_running_loop()
-    cb = _build_callback(connection_manager, cache, vault_task_cache, vault_goal_cache, loop)
-    _run_callback(cb, "modified", "My Goal", "TestVault", "goal")
-    await asyncio.sleep(0)
-    await asyncio.sleep(0)
+    cb = build_callback(connection_manager, cache, vault_task_cache, vault_goal_cache)
+    cb("modified", "My Goal", "TestVault", "goal")
+    await _drain()
 
     last_message = connection_manager.broadcast.call_args_list[-1].args[0]
     assert last_message["item_kind"] == "goal"
@@ -121,7 +139,9 @@ async def test_watcher_callback_broadcasts_item_kind_goal() -> None:
 
 
 @pytest.mark.asyncio
-async def test_no_cross_rerender_invariant() -> None:
+async def test_no_cross_rerender_invariant(
+    build_callback: Callable[..., WatcherCallback],
+) -> None:
     """A task event must not invalidate the goal cache, and a goal event
     must not invalidate the task cache (spec AC#9 evidence)."""
     connection_manager = MagicMock()
@@ -136,13 +156,11 @@ async def test_no_cross_rerender_invariant() -> None:
         "TestVault": (1.0, [])  # pre-populated
     }
 
-    loop = asyncio.get_running_loop()
-    cb = _build_callback(connection_manager, cache, vault_task_cache, vault_goal_cache, loop)
+    cb = build_callback(connection_manager, cache, vault_task_cache, vault_goal_cache)
 
     # Simulate a task event
-    _run_callback(cb, "modified", "T1", "TestVault", "task")
-    await asyncio.sleep(0)
-    await asyncio.sleep(0)
+    cb("modified", "T1", "TestVault", "task")
+    await _drain()
     # Goal cache MUST still have its entry
     assert "TestVault" in vault_goal_cache, "task event invalidated goal cache (AC#9 violation)"
     # Task cache MUST be invalidated
@@ -153,9 +171,8 @@ async def test_no_cross_rerender_invariant() -> None:
     vault_goal_cache["TestVault"] = (1.0, [])
 
     # Simulate a goal event
-    _run_callback(cb, "modified", "G1", "TestVault", "goal")
-    await asyncio.sleep(0)
-    await asyncio.sleep(0)
+    cb("modified", "G1", "TestVault", "goal")
+    await _drain()
     # Task cache MUST still have its entry
     assert "TestVault" in vault_task_cache, "goal event invalidated task cache (AC#9 violation)"
     # Goal cache MUST be invalidated
@@ -169,7 +186,9 @@ async def test_no_cross_rerender_invariant() -> None:
 
 
 @pytest.mark.asyncio
-async def test_theme_event_does_not_invalidate_either_cache() -> None:
+async def test_theme_event_does_not_invalidate_either_cache(
+    build_callback: Callable[..., WatcherCallback],
+) -> None:
     """A 'theme' (or 'objective' / empty) event invalidates neither the task
     nor the goal cache — those views are unaffected by theme changes (spec
     AC#9: only task events touch the task cache, only goal events touch the
@@ -182,12 +201,10 @@ async def test_theme_event_does_not_invalidate_either_cache() -> None:
     vault_task_cache: dict[str, tuple[float, list[Any]]] = {"TestVault": (1.0, [])}
     vault_goal_cache: dict[str, tuple[float, list[Any]]] = {"TestVault": (1.0, [])}
 
-    loop = asyncio.get_running_loop()
-    cb = _build_callback(connection_manager, cache, vault_task_cache, vault_goal_cache, loop)
+    cb = build_callback(connection_manager, cache, vault_task_cache, vault_goal_cache)
 
-    _run_callback(cb, "modified", "My Theme", "TestVault", "theme")
-    await asyncio.sleep(0)
-    await asyncio.sleep(0)
+    cb("modified", "My Theme", "TestVault", "theme")
+    await _drain()
 
     assert "TestVault" in vault_task_cache
     assert "TestVault" in vault_goal_cache